@@ -1,9 +1,53 @@
 import os
-import re
-import glob
+import math
+# Use non-interactive backend early to avoid Qt warnings on headless machines
+import matplotlib
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
+from matplotlib import rcParams
 import numpy as np
 
+TAIL_BYTES = 64 * 1024 # initial read window for parse_final_ipc
+
+# The parts of the 'seaborn-v0_8-whitegrid' style that show up in the plot,
+# applied directly instead of loading and parsing the style sheet
+WHITEGRID_STYLE = {
+    "axes.axisbelow": True,
+    "axes.edgecolor": ".8",
+    "axes.facecolor": "white",
+    "axes.grid": True,
+    "axes.labelcolor": ".15",
+    "axes.linewidth": 1.0,
+    "figure.facecolor": "white",
+    "font.family": ["sans-serif"],
+    "font.sans-serif": ["Arial", "Liberation Sans", "DejaVu Sans", "Bitstream Vera Sans", "sans-serif"],
+    "grid.color": ".8",
+    "grid.linestyle": "-",
+    "legend.frameon": False,
+    "text.color": ".15",
+    "xtick.color": ".15",
+    "xtick.direction": "out",
+    "xtick.major.size": 0.0,
+    "ytick.color": ".15",
+    "ytick.direction": "out",
+    "ytick.major.size": 0.0,
+}
+
+def _last_cumulative_ipc(text):
+    """Returns the last finite 'cumulative IPC:' value in text, or None."""
+    for line in reversed(text.splitlines()):
+        if "cumulative IPC:" not in line:
+            continue
+        # Plain string splitting is enough for ChampSim's fixed line format
+        fields = line.split("cumulative IPC:", 1)[1].split()
+        try:
+            value = float(fields[0])
+        except (IndexError, ValueError):
+            continue
+        if math.isfinite(value):
+            return value
+    return None
+
 def parse_final_ipc(filepath):
     """
     Parses a ChampSim output file to find the final cumulative IPC value.
@@ -16,16 +60,20 @@ def parse_final_ipc(filepath):
     """
     cumulative_ipc = None
     try:
-        with open(filepath, 'r') as f:
-            # Read all lines to easily find the last occurrence
-            lines = f.readlines()
-            # Iterate backwards through the file to find the last IPC entry efficiently
-            for line in reversed(lines):
-                if "cumulative IPC" in line:
-                    match = re.search(r"cumulative IPC: (\d+\.\d+)", line)
-                    if match:
-                        cumulative_ipc = float(match.group(1))
-                        break # Found the last one, no need to continue
+        with open(filepath, 'rb') as f:
+            # The final IPC is reported at the end of the run, so only read the tail
+            # of the file and widen the window if the entry is not in there
+            size = f.seek(0, 2)
+            window = TAIL_BYTES
+            while True:
+                f.seek(max(0, size - window))
+                tail = f.read().decode(errors='ignore')
+                cumulative_ipc = _last_cumulative_ipc(tail)
+                if cumulative_ipc is not None:
+                    break # Found the last one, no need to continue
+                if window >= size:
+                    break
+                window *= 2
     except FileNotFoundError:
         print(f"Warning: Could not find the file: {filepath}")
         return None
@@ -52,14 +100,18 @@ def generate_plot():
     os.makedirs(plot_dir, exist_ok=True)
 
     # --- 2. Data Extraction and Speedup Calculation ---
-    trace_files = sorted(glob.glob(os.path.join(baseline_dir, "trace*.txt")))
-    trace_files_prefetch = sorted(glob.glob(os.path.join(exclusive_dir, "trace*.txt")))
+    trace_files = sorted(entry.path for entry in os.scandir(baseline_dir)
+                         if entry.name.startswith("trace") and entry.name.endswith(".txt"))
+    trace_files_prefetch = sorted(entry.path for entry in os.scandir(exclusive_dir)
+                                  if entry.name.startswith("trace") and entry.name.endswith(".txt"))
     
     if not trace_files:
         print(f"Error: No trace files found in '{baseline_dir}'. Make sure your simulation outputs are there.")
         return
 
-    results = {}
+    trace_names = []
+    ipc_base = []
+    ipc_exc = []
     for prefetch_filepath, baseline_filepath in zip(trace_files_prefetch, trace_files):
         filename = os.path.basename(prefetch_filepath)
         exclusive_filepath = os.path.join(exclusive_dir, filename)
@@ -69,25 +121,35 @@ def generate_plot():
         
         trace_name = filename.replace('.txt', '') # For cleaner labels on the graph
 
-        if ipc_baseline is not None and ipc_exclusive is not None:
-            if ipc_baseline > 0:
-                speedup = ipc_exclusive / ipc_baseline
-                results[trace_name] = speedup
-                print(f"Processed {trace_name}: Baseline IPC={ipc_baseline:.3f}, Exclusive IPC={ipc_exclusive:.3f}, Speedup={speedup:.3f}")
-            else:
-                print(f"Warning: Baseline IPC for {trace_name} is 0. Cannot calculate speedup.")
-        else:
+        if ipc_baseline is None or ipc_exclusive is None:
             print(f"Warning: Skipping {trace_name} due to missing data in one of the files.")
+            continue
+        trace_names.append(trace_name)
+        ipc_base.append(ipc_baseline)
+        ipc_exc.append(ipc_exclusive)
+
+    # Compute all speedups at once; a zero baseline IPC yields NaN
+    ipc_base = np.array(ipc_base)
+    ipc_exc = np.array(ipc_exc)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speedup = np.where(ipc_base > 0, ipc_exc / ipc_base, np.nan)
+    valid = ~np.isnan(speedup)
+
+    for trace_name, base, exc, s in zip(trace_names, ipc_base, ipc_exc, speedup):
+        if np.isnan(s):
+            print(f"Warning: Baseline IPC for {trace_name} is 0. Cannot calculate speedup.")
+        else:
+            print(f"Processed {trace_name}: Baseline IPC={base:.3f}, Exclusive IPC={exc:.3f}, Speedup={s:.3f}")
 
-    if not results:
+    if not valid.any():
         print("Could not generate plot because no valid result pairs were found.")
         return
 
     # --- 3. Plotting ---
-    labels = list(results.keys())
-    values = list(results.values())
+    labels = [name for name, ok in zip(trace_names, valid) if ok]
+    values = speedup[valid]
 
-    plt.style.use('seaborn-v0_8-whitegrid')
+    rcParams.update(WHITEGRID_STYLE)
     fig, ax = plt.subplots(figsize=(12, 8))
     
     # Use a vibrant color palette
@@ -99,10 +161,7 @@ def generate_plot():
     ax.axhline(1.0, color='crimson', linestyle='--', linewidth=1.5, zorder=5, label='Baseline (Non-Inclusive)')
 
     # Add text labels on top of each bar for clarity
-    for bar in bars:
-        height = bar.get_height()
-        # FIX: The 'pad' property is invalid. Added a small offset to the 'height' (y-coordinate) to create padding.
-        ax.text(bar.get_x() + bar.get_width() / 2.0, height + 0.02, f'{height:.3f}', ha='center', va='bottom', fontsize=11, fontweight='bold')
+    ax.bar_label(bars, labels=[f'{v:.3f}' for v in values], padding=3, fontsize=11, fontweight='bold')
 
     # --- 4. Aesthetics and Labels ---
     ax.set_title('Exclusive Cache with prefetcher Speedup vs. Exclusive Cache no prefetcher', fontsize=14, fontweight='bold', pad=20)
@@ -110,8 +169,8 @@ def generate_plot():
     ax.set_ylabel('Speedup (IPC Exclusive / IPC Baseline)', fontsize=14, fontweight='bold', labelpad=15)
     
     # Set y-axis limits to better frame the data, ensuring 1.0 is visible
-    min_val = min(values) if values else 1.0
-    max_val = max(values) if values else 1.0
+    min_val = values.min()
+    max_val = values.max()
     ax.set_ylim([min(0.9, min_val - 0.05), max_val + 0.1])
     
     ax.tick_params(axis='x', rotation=30, labelsize=12)
@@ -10,16 +10,18 @@ Creates:
  - Beautiful side-by-side plots for IPC, L1D MPKI, L2 MPKI, LLC MPKI
  - A polished IPC speedup plot with values written above each bar (3 decimals)
  - A high-quality PNG summary table (unchanged behavior)
+ - _cache.json with the parsed per-file metrics, so reruns skip unchanged files
 
 Saves everything to: outputs_latest/plots_task2/
 """
 
 import re
 import os
-import glob
+import json
 import math
+import mmap
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
-import pandas as pd
 
 # Use non-interactive backend early to avoid Qt warnings on headless machines
 import matplotlib
@@ -32,6 +34,7 @@ DIR_NONINCLUSIVE = "outputs/no_prefetcher"
 DIR_EXCLUSIVE = "outputs_latest/exclusive_no"
 OUTPUT_DIR = "outputs_latest/plots_task2"
 TRACE_FILENAMES = ["trace1.txt", "trace2.txt", "trace3.txt", "trace4.txt"]  # expected file names
+CACHE_PATH = os.path.join(OUTPUT_DIR, "_cache.json")  # parsed metrics from previous runs
 # -----------------------------------
 
 os.makedirs(OUTPUT_DIR, exist_ok=True)
@@ -53,25 +56,61 @@ COLOR_EXCL = PALETTE(0)   # exclusive
 COLOR_NONINC = PALETTE(1) # non-inclusive
 SPEEDUP_COLOR = PALETTE(4)
 
-def parse_metrics_from_text(text):
-    """Return dict with keys: ipc, l1d_mpki, l2_mpki, llc_mpki (float or np.nan)."""
-    def search_first(pattern, text, flags=0):
-        m = re.search(pattern, text, flags)
-        return m.group(1) if m else None
-
-    ipc_s = search_first(r"CPU\s*0\s+cumulative\s+IPC:\s*([0-9]*\.?[0-9]+)", text)
-    if ipc_s is None:
-        ipc_s = search_first(r"cumulative\s+IPC:\s*([0-9]*\.?[0-9]+)", text)
-
-    l1d_s = search_first(r"L1D(?:\s+TOTAL)?[\s\S]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)", text)
-    l2_s = search_first(r"L2C(?:\s+TOTAL)?[\s\S]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)", text)
-    if l2_s is None:
-        l2_s = search_first(r"\nL2(?:\s+TOTAL)?[\s\S]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)", text)
-    llc_s = search_first(r"LLC(?:\s+TOTAL)?[\s\S]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)", text)
+# A cheap prefilter finds the literal anchor that starts each metric; only then is
+# the metric's own pattern run from that offset. The named group that matched in
+# the prefilter tells which metric (and pattern) the anchor belongs to. Every
+# pattern is confined to a single line. Byte patterns, so logs can be scanned
+# straight from the mapped file without decoding.
+_RE_PREFILTER = re.compile(
+    rb"(?P<ipc_cpu0>CPU\s*0\s+cumulative)|(?P<ipc>cumulative)"
+    rb"|(?P<l1d>L1D)|(?P<l2c>L2C)|(?P<l2>L2)|(?P<llc>LLC)"
+)
+_METRIC_RES = {
+    "ipc_cpu0": re.compile(rb"CPU\s*0\s+cumulative\s+IPC:\s*([0-9]*\.?[0-9]+)"),
+    "ipc": re.compile(rb"cumulative\s+IPC:\s*([0-9]*\.?[0-9]+)"),
+    "l1d": re.compile(rb"L1D[^\n]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)"),
+    "l2c": re.compile(rb"L2C[^\n]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)"),
+    "l2": re.compile(rb"^L2[^\n]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)"),  # only at line start
+    "llc": re.compile(rb"LLC[^\n]{0,200}?MPKI:\s*([0-9]*\.?[0-9]+)"),
+}
+
+def _match_metric(line):
+    """Return (group, value) for the leftmost metric on `line`, or None."""
+    for anchor in _RE_PREFILTER.finditer(line):
+        m = _METRIC_RES[anchor.lastgroup].match(line, anchor.start())
+        if m:
+            return anchor.lastgroup, m.group(1)
+    return None
+
+# once these groups have matched, the rest of the file cannot change the result
+_PRIMARY_GROUPS = {"ipc_cpu0", "l1d", "l2c", "llc"}
+
+def parse_metrics_from_lines(lines):
+    """Return dict with keys: ipc, l1d_mpki, l2_mpki, llc_mpki (float or np.nan).
+
+    `lines` is an iterable of bytes lines from a ChampSim output file.
+    """
+    # every metric sits on a single line, so only the handful of lines that
+    # mention MPKI or IPC are handed to the patterns; keep the first occurrence of each
+    # and stop reading as soon as all of them are known
+    found = {}
+    for line in lines:
+        if b"MPKI" not in line and b"IPC" not in line:
+            continue
+        hit = _match_metric(line)
+        if hit:
+            found.setdefault(*hit)
+            if _PRIMARY_GROUPS <= found.keys():
+                break
+
+    ipc_s = found.get("ipc_cpu0") or found.get("ipc")
+    l1d_s = found.get("l1d")
+    l2_s = found.get("l2c") or found.get("l2")
+    llc_s = found.get("llc")
 
     def tofloat(s):
         try:
-            return float(s) if s is not None else np.nan
+            return float(s.decode("ascii")) if s is not None else np.nan
         except:
             return np.nan
 
@@ -82,77 +121,138 @@ def parse_metrics_from_text(text):
         "llc_mpki": tofloat(llc_s),
     }
 
+# bump whenever parse_metrics_from_lines changes what it extracts
+CACHE_VERSION = 1
+
+def load_parse_cache(path):
+    """Return the {abspath: {mtime, ipc, ...}} map saved by a previous run, or {}."""
+    try:
+        with open(path, "r") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != CACHE_VERSION:
+        return {}
+    return data.get("files", {})
+
+def save_parse_cache(path, cache):
+    with open(path, "w") as f:
+        json.dump({"version": CACHE_VERSION, "files": cache}, f, indent=1)
+
+# parsed metrics keyed by absolute path; an entry is reused while the file's mtime is unchanged
+_parse_cache = load_parse_cache(CACHE_PATH)
+
 def parse_file(path):
     if not os.path.isfile(path):
         return None
-    with open(path, "r", encoding="utf-8", errors="ignore") as f:
-        text = f.read()
-    return parse_metrics_from_text(text)
+    key = os.path.abspath(path)
+    mtime = os.stat(path).st_mtime
+    entry = _parse_cache.get(key)
+    if entry is None or entry.get("mtime") != mtime:
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                # mmap cannot map an empty file
+                entry = parse_metrics_from_lines([])
+            else:
+                # map the file instead of reading it into a str: no decode pass, and
+                # the OS pages in only what the line scan touches
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    entry = parse_metrics_from_lines(iter(mm.readline, b""))
+        entry["mtime"] = mtime
+        _parse_cache[key] = entry
+    # callers annotate the returned dict, so hand out a copy without the mtime
+    return {k: v for k, v in entry.items() if k != "mtime"}
 
 def collect_for_dir(directory, label):
-    rows = []
+    candidates = []  # (trace number, path)
     # try expected filenames first
     for fname in TRACE_FILENAMES:
         p = os.path.join(directory, fname)
         if os.path.isfile(p):
-            trace_no = int(re.search(r"trace(\d+)\.txt", fname).group(1))
-            parsed = parse_file(p)
-            if parsed is None:
-                parsed = {"ipc": np.nan, "l1d_mpki": np.nan, "l2_mpki": np.nan, "llc_mpki": np.nan}
-            parsed.update({"trace": trace_no, "policy": label, "file": p})
-            rows.append(parsed)
-    # fallback: glob trace*.txt
-    if len(rows) == 0:
-        for p in sorted(glob.glob(os.path.join(directory, "trace*.txt"))):
+            candidates.append((int(re.search(r"trace(\d+)\.txt", fname).group(1)), p))
+    # fallback: any trace*.txt
+    if len(candidates) == 0 and os.path.isdir(directory):
+        for p in sorted(entry.path for entry in os.scandir(directory)
+                        if entry.name.startswith("trace") and entry.name.endswith(".txt")):
             m = re.search(r"trace(\d+)\.txt", os.path.basename(p))
-            trace_no = int(m.group(1)) if m else None
-            parsed = parse_file(p)
-            if parsed is None:
-                parsed = {"ipc": np.nan, "l1d_mpki": np.nan, "l2_mpki": np.nan, "llc_mpki": np.nan}
-            parsed.update({"trace": trace_no, "policy": label, "file": p})
-            rows.append(parsed)
+            candidates.append((int(m.group(1)) if m else None, p))
+    if not candidates:
+        return []
+
+    # every file is independent, so parse them concurrently
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates))) as ex:
+        parsed_list = list(ex.map(parse_file, [p for _, p in candidates]))
+
+    rows = []
+    for (trace_no, p), parsed in zip(candidates, parsed_list):
+        if parsed is None:
+            parsed = {"ipc": np.nan, "l1d_mpki": np.nan, "l2_mpki": np.nan, "llc_mpki": np.nan}
+        parsed.update({"trace": trace_no, "policy": label, "file": p})
+        rows.append(parsed)
     rows = sorted(rows, key=lambda r: (r["trace"] if r["trace"] is not None else 999))
     return rows
 
 # collect data
 exclusive_rows = collect_for_dir(DIR_EXCLUSIVE, "exclusive")
 noninc_rows = collect_for_dir(DIR_NONINCLUSIVE, "noninclusive")
+save_parse_cache(CACHE_PATH, _parse_cache)
 
 if not exclusive_rows and not noninc_rows:
     raise SystemExit("No trace files found in either directory. Please check paths.")
 
-df = pd.DataFrame(exclusive_rows + noninc_rows)
-df['trace'] = df['trace'].astype(pd.Int64Dtype())
+POLICIES = ["exclusive", "noninclusive"]
+METRIC_KEYS = ["ipc", "l1d_mpki", "l2_mpki", "llc_mpki"]
+
+def build_results(rows_by_policy):
+    """Return (traces, results) with results[policy][metric] an array aligned with traces.
+
+    Traces missing for a policy are filled with np.nan.
+    """
+    traces = sorted({r["trace"] for rows in rows_by_policy.values() for r in rows},
+                    key=lambda t: (t if t is not None else 999))
+    results = {}
+    for policy in POLICIES:
+        by_trace = {r["trace"]: r for r in rows_by_policy.get(policy, [])}
+        results[policy] = {
+            key: np.array([by_trace[t][key] if t in by_trace else np.nan for t in traces], dtype=float)
+            for key in METRIC_KEYS
+        }
+    return traces, results
+
+def ipc_speedup(results):
+    """Exclusive / non-inclusive IPC per trace, NaN where the ratio is not finite."""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        speedup = results["exclusive"]["ipc"] / results["noninclusive"]["ipc"]
+    return np.where(np.isfinite(speedup), speedup, np.nan)
+
+traces, results = build_results({"exclusive": exclusive_rows, "noninclusive": noninc_rows})
 
 # plotting utilities
-def plot_side_by_side(df, metric_key, metric_label, output_path):
-    pivot = df.pivot(index='trace', columns='policy', values=metric_key).sort_index()
-    traces = pivot.index.tolist()
+def plot_side_by_side(fig, ax, results, traces, metric_key, metric_label, output_path):
+    excl = results["exclusive"][metric_key]
+    noninc = results["noninclusive"][metric_key]
     n = len(traces)
-    # ensure both columns exist
-    for p in ["exclusive", "noninclusive"]:
-        if p not in pivot.columns:
-            pivot[p] = np.nan
 
     x = np.arange(n)
     width = 0.36
 
-    fig, ax = plt.subplots(figsize=(max(7, n*1.4), 5))
-    bars1 = ax.bar(x - width/2, pivot["exclusive"].values, width,
+    ax.clear()
+    fig.set_size_inches(max(7, n*1.4), 5)
+    xs_excl = x - width/2
+    xs_noninc = x + width/2
+    bars1 = ax.bar(xs_excl, excl, width,
                    label="exclusive", color=COLOR_EXCL, edgecolor='k', linewidth=0.4)
-    bars2 = ax.bar(x + width/2, pivot["noninclusive"].values, width,
+    bars2 = ax.bar(xs_noninc, noninc, width,
                    label="non-inclusive (baseline)", color=COLOR_NONINC, edgecolor='k', linewidth=0.4, alpha=0.95)
 
     # Add small value labels on top of bars (optional - smaller font)
-    for bar in list(bars1) + list(bars2):
-        h = bar.get_height()
-        if not np.isnan(h):
-            ax.text(bar.get_x() + bar.get_width()/2, h + (0.015 * max(1.0, h)), f"{h:.2f}",
-                    ha='center', va='bottom', fontsize=9, color='black', alpha=0.9)
+    for bars, heights in ((bars1, excl), (bars2, noninc)):
+        ax.bar_label(bars, labels=["" if np.isnan(h) else f"{h:.2f}" for h in heights],
+                     padding=3, fontsize=9, color='black', alpha=0.9)
 
     # cosmetics
     ax.set_xticks(x)
-    tick_labels = [str(int(t)) if (not pd.isna(t)) else "?" for t in traces]
+    tick_labels = [str(t) if t is not None else "?" for t in traces]
     ax.set_xticklabels(tick_labels)
     ax.set_xlabel("Trace number")
     ax.set_ylabel(metric_label)
@@ -161,49 +261,46 @@ def plot_side_by_side(df, metric_key, metric_label, output_path):
     ax.grid(axis='y', linestyle='--', linewidth=0.6, alpha=0.6)
     # subtle shadow effect - draw a faint rectangle behind
     ax.set_axisbelow(True)
-    plt.tight_layout()
+    fig.tight_layout()
     fig.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.15)
-    plt.close(fig)
     print(f"Saved plot: {output_path}")
 
 # nicer speedup plot with 3-decimal labels
-def plot_ipc_speedup(df, output_path):
-    pivot_ipc = df.pivot(index='trace', columns='policy', values='ipc').sort_index()
-    # ensure both columns exist
-    for p in ["exclusive", "noninclusive"]:
-        if p not in pivot_ipc.columns:
-            pivot_ipc[p] = np.nan
-    speedup = pivot_ipc["exclusive"] / pivot_ipc["noninclusive"]
-    speedup = speedup.replace([np.inf, -np.inf], np.nan)
-
-    traces = speedup.index.tolist()
+def plot_ipc_speedup(fig, ax, results, traces, output_path):
+    speedup = ipc_speedup(results)
+
     x = np.arange(len(traces))
 
-    fig, ax = plt.subplots(figsize=(max(7, len(traces)*1.4), 5))
+    ax.clear()
+    # clear() keeps the set_axisbelow(True) from the side-by-side plots; restore the default
+    ax.set_axisbelow(rcParams["axes.axisbelow"])
+    fig.set_size_inches(max(7, len(traces)*1.4), 5)
 
-    bars = ax.bar(x, speedup.values, width=0.6, color=SPEEDUP_COLOR, edgecolor='k', linewidth=0.6)
+    bars = ax.bar(x, speedup, width=0.6, color=SPEEDUP_COLOR, edgecolor='k', linewidth=0.6)
     # annotate each bar with 3 decimal places, centered above bar
-    for bar, val in zip(bars, speedup.values):
-        h = 0 if np.isnan(val) else val
-        label = "-" if np.isnan(val) else f"{val:.3f}"
-        # position label slightly above bar top
-        ax.text(bar.get_x() + bar.get_width()/2, h + 0.02 * max(1.0, np.nanmax(speedup.values[~np.isnan(speedup.values)]) if np.any(~np.isnan(speedup.values)) else 1.0),
-                label, ha='center', va='bottom', fontsize=10, fontweight='bold', color='black')
+    ax.bar_label(bars, labels=["" if np.isnan(val) else f"{val:.3f}" for val in speedup],
+                 padding=3, fontsize=10, fontweight='bold', color='black')
+    # bars without data have no top to label, so mark them with a dash near the baseline
+    valid = speedup[~np.isnan(speedup)]
+    top_ref = valid.max() if valid.size else 1.0
+    offset = 0.02 * max(1.0, top_ref)
+    for xi, val in zip(x, speedup):
+        if np.isnan(val):
+            ax.text(xi, offset, "-", ha='center', va='bottom', fontsize=10, fontweight='bold', color='black')
 
     # draw reference line at speedup = 1.0
     ax.axhline(1.0, linestyle='--', linewidth=1.0, color='#333333', alpha=0.7)
     ax.text(0.98, 1.02, "baseline = 1.0", ha='right', va='bottom', transform=ax.get_yaxis_transform(), fontsize=9, color='#333333')
 
     ax.set_xticks(x)
-    tick_labels = [str(int(t)) if (not pd.isna(t)) else "?" for t in traces]
+    tick_labels = [str(t) if t is not None else "?" for t in traces]
     ax.set_xticklabels(tick_labels)
     ax.set_xlabel("Trace number")
     ax.set_ylabel("IPC speedup (exclusive / non-inclusive)")
     ax.set_title("IPC speedup: exclusive / non-inclusive (baseline)", pad=14)
     ax.grid(axis='y', linestyle='--', linewidth=0.6, alpha=0.6)
-    plt.tight_layout()
+    fig.tight_layout()
     fig.savefig(output_path, dpi=300, bbox_inches='tight', pad_inches=0.12)
-    plt.close(fig)
     print(f"Saved speedup plot: {output_path}")
 
 # Create the plots
@@ -214,45 +311,39 @@ metrics = [
     ("llc_mpki", "LLC MPKI"),
 ]
 
+# the bar plots all share one figure; each plot clears the axes and resizes it
+fig, ax = plt.subplots(figsize=(max(7, len(traces)*1.4), 5))
+
 for key, label in metrics:
     out_png = os.path.join(OUTPUT_DIR, f"{key}.png")
-    plot_side_by_side(df, key, label, out_png)
+    plot_side_by_side(fig, ax, results, traces, key, label, out_png)
 
 speedup_png = os.path.join(OUTPUT_DIR, "ipc_speedup.png")
-plot_ipc_speedup(df, speedup_png)
+plot_ipc_speedup(fig, ax, results, traces, speedup_png)
+plt.close(fig)
 
 # ------------------------
 # Build a single combined summary table (per-trace)
 # ------------------------
-def build_summary_table(df):
-    def pivot_metric(metric):
-        p = df.pivot(index='trace', columns='policy', values=metric).sort_index()
-        for c in ["exclusive", "noninclusive"]:
-            if c not in p.columns:
-                p[c] = np.nan
-        return p.rename(columns={"exclusive": f"exclusive_{metric}", "noninclusive": f"noninclusive_{metric}"})
-
-    p_ipc = pivot_metric("ipc")
-    p_l1d = pivot_metric("l1d_mpki")
-    p_l2  = pivot_metric("l2_mpki")
-    p_llc = pivot_metric("llc_mpki")
-
-    combined = pd.concat([p_ipc, p_l1d, p_l2, p_llc], axis=1)
-    combined["speedup_ipc"] = combined["exclusive_ipc"] / combined["noninclusive_ipc"]
-    combined = combined.reset_index().rename(columns={"trace": "Trace"})
-    cols = ["Trace",
-            "exclusive_ipc", "noninclusive_ipc", "speedup_ipc",
-            "exclusive_l1d_mpki", "noninclusive_l1d_mpki",
-            "exclusive_l2_mpki", "noninclusive_l2_mpki",
-            "exclusive_llc_mpki", "noninclusive_llc_mpki"]
-    existing_cols = [c for c in cols if c in combined.columns]
-    combined = combined[existing_cols]
-    return combined
-
-summary_df = build_summary_table(df)
+SUMMARY_COLUMNS = ["Trace",
+                   "exclusive_ipc", "noninclusive_ipc", "speedup_ipc",
+                   "exclusive_l1d_mpki", "noninclusive_l1d_mpki",
+                   "exclusive_l2_mpki", "noninclusive_l2_mpki",
+                   "exclusive_llc_mpki", "noninclusive_llc_mpki"]
+
+def build_summary_table(results, traces):
+    """Return one row per trace, with values in SUMMARY_COLUMNS order."""
+    columns = {"Trace": traces}
+    for policy in POLICIES:
+        for metric in METRIC_KEYS:
+            columns[f"{policy}_{metric}"] = results[policy][metric]
+    columns["speedup_ipc"] = ipc_speedup(results)
+    return [[columns[c][i] for c in SUMMARY_COLUMNS] for i in range(len(traces))]
+
+summary_rows = build_summary_table(results, traces)
 
 def format_val(col, v):
-    if pd.isna(v):
+    if v is None or (isinstance(v, float) and math.isnan(v)):
         return "-"
     if "ipc" in col and "speedup" not in col:
         return f"{v:.3f}"
@@ -262,13 +353,11 @@ def format_val(col, v):
         return f"{v:.2f}"
     return f"{v}"
 
-display_df = summary_df.copy()
-for col in display_df.columns:
-    display_df[col] = display_df[col].apply(lambda v, c=col: format_val(c, v))
+display_rows = [[format_val(c, v) for c, v in zip(SUMMARY_COLUMNS, row)] for row in summary_rows]
 
 # Save table PNG (robust version)
-def save_table_png(table_df: pd.DataFrame, outpath: str, title: str = None, dpi: int = 300):
-    nrows, ncols = table_df.shape
+def save_table_png(col_labels: list, cell_text: list, outpath: str, title: str = None, dpi: int = 300):
+    nrows, ncols = len(cell_text), len(col_labels)
     col_width = 1.6
     row_height = 0.45
     header_height = 0.8
@@ -286,13 +375,13 @@ def save_table_png(table_df: pd.DataFrame, outpath: str, title: str = None, dpi:
     header_text_color = "white"
     row_colors = ["#ffffff", "#f7fbfc"]
 
-    cell_text = table_df.values.tolist()
-    col_labels = table_df.columns.tolist()
-
-    # equal column widths
+    # equal column widths; background colors are passed up front so only the
+    # header row and the first column need per-cell styling afterwards
     col_widths = [1.0 / max(1, ncols)] * ncols
     the_table = ax.table(cellText=cell_text,
                          colLabels=col_labels,
+                         cellColours=[[row_colors[r % 2]] * ncols for r in range(nrows)],
+                         colColours=[header_color] * ncols,
                          loc='center',
                          cellLoc='center',
                          colWidths=col_widths)
@@ -301,15 +390,12 @@ def save_table_png(table_df: pd.DataFrame, outpath: str, title: str = None, dpi:
     font_size = max(8, min(12, int(180 / max(6, ncols))))
     the_table.set_fontsize(font_size)
 
-    for (row, col), cell in the_table.get_celld().items():
-        if row == 0:
-            cell.set_facecolor(header_color)
-            cell.set_text_props(weight='bold', color=header_text_color)
-            cell.set_height(header_height / fig_h)
-        else:
-            cell.set_facecolor(row_colors[(row - 1) % 2])
-            if col == 0:
-                cell.set_text_props(weight='bold')
+    for col in range(ncols):
+        cell = the_table[0, col]
+        cell.set_text_props(weight='bold', color=header_text_color)
+        cell.set_height(header_height / fig_h)
+    for row in range(1, nrows + 1):
+        the_table[row, 0].set_text_props(weight='bold')
 
     the_table.scale(1, 1.15)
     plt.tight_layout()
@@ -319,7 +405,7 @@ def save_table_png(table_df: pd.DataFrame, outpath: str, title: str = None, dpi:
 
 table_png_path = os.path.join(OUTPUT_DIR, "metrics_summary_table.png")
 title = "Per-trace metrics: Exclusive vs Non-Inclusive (speedup = exclusive / non-inclusive)"
-save_table_png(display_df, table_png_path, title=title, dpi=300)
+save_table_png(SUMMARY_COLUMNS, display_rows, table_png_path, title=title, dpi=300)
 
 print("Done. Files saved to:", OUTPUT_DIR)
 print("Plots:")